@@ -35,6 +35,8 @@ Functions
     - Register configuration data as variables.
 - load_register_config_{format}(file:str, default:<data_types>|None=None, check:bool=True, list_name:str="CONFIG_LIST", in_module:bool=True) -> dict[str,str]|tuple[dict[str,str],str]:
     - Load a configuration file of a specified format, and register the data.
+- make_loader_{format}(default:<data_types>|None=None, check:bool=True) -> function:
+    - Make a loader specialized for one fixed default data, for repeated loading.
 
 Function Alias Rules
 --------------------
@@ -65,7 +67,73 @@ The module allows setting different behaviors for these exceptions, options are
 __version__ = "2.0.0"
 
 from typing import Union
+from collections.abc import Mapping
 import json
+import mmap
+import os
+import sys
+
+try:    # orjson parses and serializes at C speed, fall back to the stdlib when it isn't installed
+    import orjson
+    _HAS_ORJSON = True
+    _loads = orjson.loads
+    def _dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _HAS_ORJSON = False
+    _loads = json.loads
+    _ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)    # built once, json.dumps constructs one per call
+    def _dumps(data):
+        return _ENCODER.encode(data).encode("utf-8")
+
+try:    # pysimdjson validates UTF-8 and structure with SIMD, worth using when no key checking follows
+    import simdjson
+
+    class _LazyDict(Mapping):
+        # Read-only view over a parsed simdjson document. The SIMD parse (and therefore syntax
+        # validation) has already happened; only the conversion of values to Python objects is
+        # deferred until a key is actually read, which is the expensive part for big configs.
+        __slots__ = ("_parser", "_doc", "_memo", "_keys")
+
+        def __init__(self, parser, doc):
+            self._parser = parser    # pin the parser, the document reads from its internal tape
+            self._doc = doc
+            self._memo = {}
+            self._keys = tuple(doc.keys())
+
+        def __getitem__(self, key):
+            try:
+                return self._memo[key]
+            except KeyError:
+                value = self._doc[key]
+                if isinstance(value, simdjson.Object):
+                    value = value.as_dict()
+                elif isinstance(value, simdjson.Array):
+                    value = value.as_list()
+                self._memo[key] = value
+                return value
+
+        def __iter__(self):
+            return iter(self._keys)
+
+        def __len__(self):
+            return len(self._keys)
+
+    def _fast_loads(buf):
+        parser = simdjson.Parser()    # fresh parser per document so the lazy view can outlive this call
+        doc = parser.parse(buf)
+        if isinstance(doc, simdjson.Object):
+            return _LazyDict(parser, doc)
+        if isinstance(doc, simdjson.Array):
+            return doc.as_list()
+        return doc
+except ImportError:
+    _fast_loads = None
+
+_DEFAULT_TYPES = (dict, list, type(None))    # prebuilt so the isinstance guards don't allocate a tuple per call
+_DATA_TYPES = (dict, list)
+
+_MMAP_THRESHOLD = 65536    # below this, mmap setup costs more than the read it saves
 
 BEHAVIOUR_OPTIONS = {
     "NotFound":        ["create","error"],
@@ -75,14 +143,131 @@ BEHAVIOUR_OPTIONS = {
     "DisorderedKeys":  ["sort","ignore","error"]
 }
 
-__behaviour_settings = {
-    "NotFound":"create",
-    "SyntaxError":"reset",
-    "MissingKeys":"append",
-    "ExtraKeys":"delete",
-    "DisorderedKeys":"sort"
+class _Beh:    # indices into _BEH, a list subscript is cheaper than a dict lookup on the hot paths
+    NOTFOUND = 0
+    SYNTAX = 1
+    MISSING = 2
+    EXTRA = 3
+    DISORDER = 4
+
+_BEH_INDEX = {
+    "NotFound":        _Beh.NOTFOUND,
+    "SyntaxError":     _Beh.SYNTAX,
+    "MissingKeys":     _Beh.MISSING,
+    "ExtraKeys":       _Beh.EXTRA,
+    "DisorderedKeys":  _Beh.DISORDER
 }
 
+# the current behaviour per exception, only behaviour_config may assign into this
+_BEH = [sys.intern(b) for b in ("create","reset","append","delete","sort")]
+
+# Repair handlers for the check block. One per behaviour, selected once in behaviour_config so the
+# hot path calls a pre-bound function instead of walking a string-comparison ladder on every load.
+# Each takes the current data and returns the (possibly rebuilt) data.
+
+def _missing_append(data, default, keys, extra_keys, file):
+    for key in keys:
+        data[key] = default[key]
+    return data
+
+def _missing_append_sort(data, default, keys, extra_keys, file):
+    if not extra_keys and len(keys) < len(default) // 4:
+        return {k: data[k] if k in data else default[k] for k in default}    # one C-level pass instead of copying every default value
+    temp_data = default.copy()
+    temp_data.update(data)    # keep the order of the default keys and add the extra keys in original order at the end
+    return temp_data
+
+def _missing_reset(data, default, keys, extra_keys, file):
+    return default
+
+def _missing_error(data, default, keys, extra_keys, file):
+    raise ValueError(f"Missing keys in {file}: {', '.join(keys)}")
+
+def _extra_delete(data, default, keys, file):
+    for key in keys:
+        data.pop(key, None)    # pop with a default skips the KeyError machinery del would arm
+    return data
+
+def _extra_delete_sort(data, default, keys, file):
+    common = default.keys() & data.keys()    # one C-level intersection up front
+    return {k: data[k] for k in default if k in common}    # iterate default so the result keeps its order
+
+def _extra_reset(data, default, keys, file):
+    return default
+
+def _extra_error(data, default, keys, file):
+    raise ValueError(f"Extra keys in {file}: {', '.join(keys)}")
+
+def _disorder_sort(data, default, file):
+    return {k: data[k] for k in default.keys()}
+
+def _disorder_error(data, default, file):
+    raise ValueError(f"Keys are not in the same order as in the default data.")
+
+def _ignore(data, default, *args):
+    return data
+
+_MISSING_HANDLERS = {
+    "append":       _missing_append,
+    "append+sort":  _missing_append_sort,
+    "reset":        _missing_reset,
+    "ignore":       _ignore,
+    "error":        _missing_error
+}
+_EXTRA_HANDLERS = {
+    "delete":       _extra_delete,
+    "delete+sort":  _extra_delete_sort,
+    "reset":        _extra_reset,
+    "ignore":       _ignore,
+    "error":        _extra_error
+}
+_DISORDER_HANDLERS = {
+    "sort":    _disorder_sort,
+    "ignore":  _ignore,
+    "error":   _disorder_error
+}
+
+# the handlers currently selected, rebound by behaviour_config
+_missing_handler = _MISSING_HANDLERS[_BEH[_Beh.MISSING]]
+_extra_handler = _EXTRA_HANDLERS[_BEH[_Beh.EXTRA]]
+_disorder_handler = _DISORDER_HANDLERS[_BEH[_Beh.DISORDER]]
+
+class _ConfigSnapshot:
+    # Records that a file revision validated cleanly against a default with a given key set, so a
+    # reload of the same revision can skip the whole check block. __slots__ keeps the per-file cost
+    # to a few pointers instead of an instance dict. Size is part of the revision identity: mtime
+    # alone misses same-mtime rewrites (rsync -t, cp -p, archive extraction).
+    __slots__ = ("path", "mtime", "size", "keys_hash")
+
+    def __init__(self, path, mtime, size, keys_hash):
+        self.path = path
+        self.mtime = mtime
+        self.size = size
+        self.keys_hash = keys_hash
+
+_SNAPSHOTS = {}    # abspath -> _ConfigSnapshot of the last clean check
+_SNAPSHOTS_MAX = 256
+
+_DEFAULT_KEYSETS = {}    # id(default) -> (default, frozenset of its keys)
+_DEFAULT_KEYSETS_MAX = 256
+
+def _keyset(default:dict) -> frozenset:
+    # Callers almost always pass the same module-level default dict on every load, so build its
+    # frozenset once per object. Each entry keeps a strong reference to its default and the lookup
+    # verifies identity: ids recycle once a dict is collected, so the id alone is not enough. The
+    # table is wiped when full so entries cannot accumulate.
+    key = id(default)
+    entry = _DEFAULT_KEYSETS.get(key)
+    if entry is not None and entry[0] is default:
+        keyset = entry[1]
+        if len(keyset) == len(default):    # length check catches most in-place mutations of default
+            return keyset
+    if len(_DEFAULT_KEYSETS) >= _DEFAULT_KEYSETS_MAX:
+        _DEFAULT_KEYSETS.clear()
+    keyset = frozenset(default)
+    _DEFAULT_KEYSETS[key] = (default, keyset)
+    return keyset
+
 def behaviour_config(exception:str, behaviour:str):
     """
     Set the behaviour for a specific exception when loading.
@@ -103,10 +288,19 @@ def behaviour_config(exception:str, behaviour:str):
         raise ValueError(f"Invalid exception: \"{exception}\".")
     if behaviour not in BEHAVIOUR_OPTIONS[exception]:
         raise ValueError(f"Invalid behaviour \"{behaviour}\" for exception \"{exception}\".")
-    __behaviour_settings[exception] = behaviour
+    global _missing_handler, _extra_handler, _disorder_handler
+    _BEH[_BEH_INDEX[exception]] = sys.intern(behaviour)    # interned so hot-path equality is usually a pointer compare
+    if exception == "MissingKeys":    # rebind the selected handler here, not on every load
+        _missing_handler = _MISSING_HANDLERS[behaviour]
+    elif exception == "ExtraKeys":
+        _extra_handler = _EXTRA_HANDLERS[behaviour]
+    elif exception == "DisorderedKeys":
+        _disorder_handler = _DISORDER_HANDLERS[behaviour]
 
 class ConfigSyntaxError(Exception): pass
 
+_MODULE_NS = globals()    # registration target for register_config_json(in_module=True)
+
 def load_config_json(file:str, default:Union[dict,list,None]=None, check:bool=True) -> tuple[dict[str,str],Union[dict,list]]:
     """
     (alias: LJconfig)
@@ -121,7 +315,7 @@ def load_config_json(file:str, default:Union[dict,list,None]=None, check:bool=Tr
     :param check: Whether to check the data. Will check only if the data is a dictionary and will check if the keys are missing or extra, and if the keys are in the default data's order. And will check the order only if there are no missing or extra keys. 
     :type check: bool
 
-    :return (warnings, data): A tuple containing the warnings and the data. In the warnings dict, the keys are the exception names and the values are the exception messages (sometines may be empty strings). If there are no warnings, it will be an empty dict.
+    :return (warnings, data): A tuple containing the warnings and the data. In the warnings dict, the keys are the exception names and the values are the exception messages (sometines may be empty strings). If there are no warnings, it will be an empty dict. If check is False, no default is given and pysimdjson is installed, a dict result is a read-only lazy mapping that converts values when they are first read.
     :rtype: tuple[dict[str,str],dict|list]
 
     :raises TypeError: If parameters are not of the correct type.
@@ -135,77 +329,204 @@ def load_config_json(file:str, default:Union[dict,list,None]=None, check:bool=Tr
     warnings = {}
     if not isinstance(file, str):
         raise TypeError("'file' must be a string.")
-    if not isinstance(default, (dict, list, type(None))):
+    if not isinstance(default, _DEFAULT_TYPES):
         raise TypeError("'default' must be a dict, a list or None.")
     if not isinstance(check, bool):
         raise TypeError("'check' must be a boolean.")
-    
+
     try:
-        with open(file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        fd = os.open(file, os.O_RDONLY | getattr(os, "O_BINARY", 0))    # skip the io wrapper stack, both parsers take UTF-8 bytes directly
     except FileNotFoundError:
         warnings["NotFound"] = ""
-        if __behaviour_settings["NotFound"]=="error":
+        if _BEH[_Beh.NOTFOUND]=="error":
             raise FileNotFoundError(f"Configuration file not found: {file}.")
         save_config_json(file, default)
-        data = default
-    except json.JSONDecodeError as e:
+        return warnings, default    # default is well-formed by definition, checking it against itself is wasted work
+
+    try:
+        st = os.fstat(fd)    # sizes the read and identifies the file revision for the snapshot table
+        if _HAS_ORJSON and st.st_size >= _MMAP_THRESHOLD:
+            buf = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)    # the mapping holds its own handle, fd can close below
+        else:
+            buf = os.read(fd, st.st_size)    # one syscall, one allocation
+    finally:
+        os.close(fd)
+
+    try:    # narrow scope: only the JSON parse can raise in here
+        if isinstance(buf, mmap.mmap):
+            with buf:
+                view = memoryview(buf)    # orjson takes memoryview but not mmap itself, still no bytes copy
+                try:
+                    data = _loads(view)
+                finally:
+                    view.release()    # the mapping can't close while a view is exported
+        elif _fast_loads is not None and not check and default is None:
+            data = _fast_loads(buf)    # nothing will be diffed afterwards, the SIMD parse is all we need
+        else:
+            data = _loads(buf)
+    except ValueError as e:    # covers json.JSONDecodeError and orjson.JSONDecodeError
         warnings["SyntaxError"] = ""
-        if __behaviour_settings["SyntaxError"]=="error":
+        if _BEH[_Beh.SYNTAX]=="error":
             raise ConfigSyntaxError(f"JSON syntax error: {e}")
         save_config_json(file, default)
-        data = default
-    
+        return warnings, default    # same as above, skip the check block
+
+
     if check and isinstance(data, dict):
         if default == None:
             raise ValueError("Default data must be provided if you need to check.")
-        missing_keys = set(default.keys()) - set(data.keys())
-        extra_keys = set(data.keys()) - set(default.keys())
-        if missing_keys:
-            warnings["MissingKeys"] = ','.join(missing_keys)
-            if __behaviour_settings["MissingKeys"] == "append":
-                for key in missing_keys:
-                    data[key] = default[key]
-            elif __behaviour_settings["MissingKeys"] == "append+sort":
-                temp_data = default.copy()
-                temp_data.update(data)    # keep the order of the default keys and add the extra keys in original order at the end
-                data = temp_data
-            elif __behaviour_settings["MissingKeys"] == "reset":
-                data = default
-            elif __behaviour_settings["MissingKeys"] == "ignore":
-                pass
-            elif __behaviour_settings["MissingKeys"] == "error":
-                raise ValueError(f"Missing keys in {file}: {', '.join(missing_keys)}")
-        if extra_keys:
-            warnings["ExtraKeys"] = ','.join(extra_keys)
-            if not __behaviour_settings["MissingKeys"] == "reset":    # if one is set to "reset" and both happen, reset, no more operations below
-                if __behaviour_settings["ExtraKeys"] == "delete":
-                    for key in extra_keys:
-                        del data[key]
-                elif __behaviour_settings["ExtraKeys"] == "delete+sort":
-                    temp_data = {}
-                    for key in default.keys():
-                        if key in data:
-                            temp_data[key] = data[key]
-                    data = temp_data
-                elif __behaviour_settings["ExtraKeys"] == "reset":
-                    data = default
-                elif __behaviour_settings["ExtraKeys"] == "ignore":
-                    pass
-                elif __behaviour_settings["ExtraKeys"] == "error":
-                    raise ValueError(f"Extra keys in {file}: {', '.join(extra_keys)}")
-    
-        if not (missing_keys or extra_keys):
-            if default.keys() != data.keys():
-                warnings["DisorderedKeys"] = ""
-                if __behaviour_settings["DisorderedKeys"] == "sort":
-                    data = {k: data[k] for k in default.keys()}
-                elif __behaviour_settings["DisorderedKeys"] == "ignore":
-                    pass
-                elif __behaviour_settings["DisorderedKeys"] == "error":
-                    raise ValueError(f"Keys are not in the same order as in the default data.")
+        abspath = os.path.abspath(file)
+        default_hash = hash(_keyset(default))    # frozensets cache their hash, O(1) after the first call
+        snapshot = _SNAPSHOTS.get(abspath)
+        if snapshot is not None and snapshot.mtime == st.st_mtime_ns and snapshot.size == st.st_size and snapshot.keys_hash == default_hash:
+            pass    # this file revision already validated cleanly against a default with these keys
+        else:
+            mk_beh = _BEH[_Beh.MISSING]    # still needed for the reset interaction below
+            dk, xk = default.keys(), data.keys()
+            keys_match = dk == xk
+            if keys_match:    # the overwhelmingly common case, skip both set differences
+                missing_keys = extra_keys = frozenset()
+            else:
+                dset = _keyset(default)    # reuses the frozenset built on the previous load with this default
+                extra_keys = [k for k in xk if k not in dset]
+                if len(xk) - len(extra_keys) == len(default):
+                    missing_keys = []    # every default key is among the common ones, skip the second scan
+                else:
+                    missing_keys = [k for k in dk if k not in data]
+            if missing_keys:
+                warnings["MissingKeys"] = ','.join(missing_keys)
+                data = _missing_handler(data, default, missing_keys, extra_keys, file)
+            if extra_keys:
+                warnings["ExtraKeys"] = ','.join(extra_keys)
+                if not mk_beh == "reset":    # if one is set to "reset" and both happen, reset, no more operations below
+                    data = _extra_handler(data, default, extra_keys, file)
+
+            if not (missing_keys or extra_keys):
+                if not keys_match:
+                    warnings["DisorderedKeys"] = ""
+                    data = _disorder_handler(data, default, file)
+
+            if not warnings:    # clean: remember so the next load of this revision skips the diff
+                if len(_SNAPSHOTS) >= _SNAPSHOTS_MAX:
+                    _SNAPSHOTS.clear()
+                _SNAPSHOTS[abspath] = _ConfigSnapshot(abspath, st.st_mtime_ns, st.st_size, default_hash)
+
     return warnings, data
 
+def make_loader_json(default:Union[dict,list,None]=None, check:bool=True):
+    """
+    Make a loader specialized for one fixed default data.
+
+    For callers that load the same configuration with the same default many times (hot reloading and the like), this pre-binds everything that *'load_config_json'* would recompute per call: the type checks, the default's keyset and its hash, and the behaviour handlers. The returned loader takes only the file path and behaves like *'load_config_json(file, default, check)'*.
+
+    .. Note::
+        The loader snapshots the behaviours in effect when it is created. Calling *'behaviour_config'* afterwards does not change an existing loader; make a new one.
+
+    :param default: The default data to check and repair, fixed for this loader.
+    :type default: dict|list|None
+    :param check: Whether the loader checks the data, fixed for this loader.
+    :type check: bool
+
+    :return loader: A function loader(file) -> (warnings, data). About the results and the exceptions raised when loading, see *'load_config_json'*.
+
+    :raises TypeError: If parameters are not of the correct type.
+    """
+    if not isinstance(default, _DEFAULT_TYPES):
+        raise TypeError("'default' must be a dict, a list or None.")
+    if not isinstance(check, bool):
+        raise TypeError("'check' must be a boolean.")
+
+    # everything below is bound into the closure once instead of being looked up per load
+    if isinstance(default, dict):
+        dset = _keyset(default)
+        default_hash = hash(dset)
+    else:
+        dset = default_hash = None
+    nf_error = _BEH[_Beh.NOTFOUND] == "error"
+    syn_error = _BEH[_Beh.SYNTAX] == "error"
+    mk_reset = _BEH[_Beh.MISSING] == "reset"
+    missing_handler = _missing_handler
+    extra_handler = _extra_handler
+    disorder_handler = _disorder_handler
+    open_flags = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+    def loader(file):
+        warnings = {}
+        try:
+            fd = os.open(file, open_flags)
+        except FileNotFoundError:
+            warnings["NotFound"] = ""
+            if nf_error:
+                raise FileNotFoundError(f"Configuration file not found: {file}.")
+            save_config_json(file, default)
+            return warnings, default
+
+        try:
+            st = os.fstat(fd)
+            if _HAS_ORJSON and st.st_size >= _MMAP_THRESHOLD:
+                buf = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            else:
+                buf = os.read(fd, st.st_size)
+        finally:
+            os.close(fd)
+
+        try:
+            if isinstance(buf, mmap.mmap):
+                with buf:
+                    view = memoryview(buf)
+                    try:
+                        data = _loads(view)
+                    finally:
+                        view.release()
+            else:
+                data = _loads(buf)
+        except ValueError as e:
+            warnings["SyntaxError"] = ""
+            if syn_error:
+                raise ConfigSyntaxError(f"JSON syntax error: {e}")
+            save_config_json(file, default)
+            return warnings, default
+
+        if check and isinstance(data, dict):
+            if default == None:
+                raise ValueError("Default data must be provided if you need to check.")
+            abspath = os.path.abspath(file)
+            snapshot = _SNAPSHOTS.get(abspath)
+            if snapshot is not None and snapshot.mtime == st.st_mtime_ns and snapshot.size == st.st_size and snapshot.keys_hash == default_hash:
+                pass    # this file revision already validated cleanly against a default with these keys
+            else:
+                dk, xk = default.keys(), data.keys()
+                keys_match = dk == xk
+                if keys_match:
+                    missing_keys = extra_keys = frozenset()
+                else:
+                    extra_keys = [k for k in xk if k not in dset]
+                    if len(xk) - len(extra_keys) == len(default):
+                        missing_keys = []
+                    else:
+                        missing_keys = [k for k in dk if k not in data]
+                if missing_keys:
+                    warnings["MissingKeys"] = ','.join(missing_keys)
+                    data = missing_handler(data, default, missing_keys, extra_keys, file)
+                if extra_keys:
+                    warnings["ExtraKeys"] = ','.join(extra_keys)
+                    if not mk_reset:
+                        data = extra_handler(data, default, extra_keys, file)
+
+                if not (missing_keys or extra_keys):
+                    if not keys_match:
+                        warnings["DisorderedKeys"] = ""
+                        data = disorder_handler(data, default, file)
+
+                if not warnings:
+                    if len(_SNAPSHOTS) >= _SNAPSHOTS_MAX:
+                        _SNAPSHOTS.clear()
+                    _SNAPSHOTS[abspath] = _ConfigSnapshot(abspath, st.st_mtime_ns, st.st_size, default_hash)
+
+        return warnings, data
+
+    return loader
+
 def save_config_json(file:str, data:Union[dict,list]) -> None:
     """
     (alias: SJconfig)
@@ -222,11 +543,20 @@ def save_config_json(file:str, data:Union[dict,list]) -> None:
     """
     if not isinstance(file, str):
         raise TypeError("'file' must be a string.")
-    if not isinstance(data, (dict, list)):
+    if not isinstance(data, _DATA_TYPES):
         raise TypeError("'data' must be a dict, a list or None.")
         
-    with open(file, 'w', encoding='utf-8') as f:    # do not catch exceptions when writing, let them propagate
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    tmp = f"{file}.tmp.{os.getpid()}"
+    try:
+        with open(tmp, 'wb') as f:    # do not catch exceptions when writing, let them propagate
+            f.write(_dumps(data))
+        os.replace(tmp, file)    # atomic rename: readers never see a truncated or half-written file
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
 
 def register_config_json(data:Union[dict,list], list_name:str="CONFIG_LIST", in_module:bool=True) -> Union[None,str]:    # TODO: add upper keys option
     """
@@ -256,7 +586,7 @@ def register_config_json(data:Union[dict,list], list_name:str="CONFIG_LIST", in_
         exec(register_config_json(data, in_module=False))
         print(a)
 
-    :param data: The data to register.
+    :param data: The data to register. A read-only mapping (like the lazy view a check-free load can return) is materialized to a dict first.
     :type data: dict|list
     :param list_name: The name of the list variable to register if the data is a list.
     :type list_name: str
@@ -268,17 +598,19 @@ def register_config_json(data:Union[dict,list], list_name:str="CONFIG_LIST", in_
 
     :raises TypeError: If parameters are not of the correct type.
     """
-    if not isinstance(data, (dict, list)):
-        raise TypeError("'data' must be a dict or a list.")
+    if not isinstance(data, _DATA_TYPES):
+        if isinstance(data, Mapping):    # lazy views from check-free loads register like plain dicts
+            data = dict(data)
+        else:
+            raise TypeError("'data' must be a dict or a list.")
     if not isinstance(in_module, bool):
         raise TypeError("'in_module' must be a boolean.")
     
     if in_module:
         if isinstance(data, dict):
-            for key, value in data.items():
-                exec(f"global {key}\n{key} = value")
+            _MODULE_NS.update(data)    # direct dict assignment, no exec compile per key
         else:
-            exec(f"global {list_name}\n{list_name} = data")
+            _MODULE_NS[list_name] = data
     else:
         if isinstance(data, dict):
             return "\n".join([f"{key} = {repr(value)}" for key, value in data.items()])    # if do not repr, strings will be parsed as literal values rather than string expressions.